@@ -24,11 +24,12 @@ def lru_acache(maxsize: int = 128):
     """
     Caches an async function's return value each time it is called.
 
-    If the maxsize is reached, the least recently used value is removed.
+    If the maxsize is reached, the least recently used value is removed. Concurrent calls with the same arguments are computed only once.
     """
 
     def decorator(func):
         cache: OrderedDict[tuple, Awaitable] = OrderedDict()
+        locks: dict[tuple, asyncio.Lock] = {}
 
         @wraps(func)
         async def wrapper(*args, **kwargs) -> Awaitable:
@@ -44,14 +45,24 @@ def lru_acache(maxsize: int = 128):
                 cache.move_to_end(key)
                 return cache[key]
 
-            # Compute the value since it's not cached
-            value = await func(*args, **kwargs)
-            cache[key] = value
-            cache.move_to_end(key)
+            # Wait for any concurrent computation of the same key
+            async with locks.setdefault(key, asyncio.Lock()):
+                # Value may have been computed while waiting
+                if key in cache:
+                    cache.move_to_end(key)
+                    return cache[key]
 
-            # Remove the least recently used key if the cache is full
-            if len(cache) > maxsize:
-                cache.popitem(last=False)
+                # Compute the value since it's not cached
+                value = await func(*args, **kwargs)
+                cache[key] = value
+                cache.move_to_end(key)
+
+                # Remove the least recently used key if the cache is full
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+
+            # Lock is not needed anymore, next calls will hit the cache
+            locks.pop(key, None)
 
             return value
 
@@ -1,7 +1,11 @@
 import asyncio
+import hashlib
+import re
 from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
+from logging import ERROR, WARNING
 
+import orjson
 from aiojobs import Scheduler
 from azure.cognitiveservices.speech import (
     SpeechSynthesizer,
@@ -20,8 +24,8 @@ from azure.communication.callautomation import (
 )
 from azure.communication.callautomation.aio import CallAutomationClient
 from azure.core.exceptions import ClientAuthenticationError, HttpResponseError
-from pydantic import ValidationError
 
+from app.helpers.cache import lru_cache
 from app.helpers.call_llm import load_llm_chat
 from app.helpers.call_utils import (
     ContextEnum as CallContextEnum,
@@ -46,9 +50,37 @@ from app.models.message import (
 from app.models.next import NextModel
 from app.models.synthesis import SynthesisModel
 
+_cache = CONFIG.cache.instance
 _sms = CONFIG.sms.instance
 _db = CONFIG.database.instance
 
+# Error raised by Communication Services when an incoming call event is expired
+_OLD_CALL_PATTERN = re.compile(
+    r"lifetime validation of the signed http request failed", re.IGNORECASE
+)
+
+# Known media play errors, by error code, with their log level and reason
+# See: https://github.com/MicrosoftDocs/azure-docs/blob/main/articles/communication-services/how-tos/call-automation/play-action.md
+_PLAY_ERRORS: dict[int, tuple[int, str]] = {
+    8535: (WARNING, "file format is invalid"),
+    8536: (WARNING, "file could not be downloaded"),
+    8565: (ERROR, "impossible to connect with Azure AI services"),
+    9999: (WARNING, "unknown internal server error"),
+}
+
+# DTMF tones for the IVR, by language order
+_IVR_TONES = (
+    DtmfTone.ONE,
+    DtmfTone.TWO,
+    DtmfTone.THREE,
+    DtmfTone.FOUR,
+    DtmfTone.FIVE,
+    DtmfTone.SIX,
+    DtmfTone.SEVEN,
+    DtmfTone.EIGHT,
+    DtmfTone.NINE,
+)
+
 
 @start_as_current_span("on_new_call")
 async def on_new_call(
@@ -90,7 +122,7 @@ async def on_new_call(
         )
 
     except HttpResponseError as e:
-        if "lifetime validation of the signed http request failed" in e.message.lower():
+        if _OLD_CALL_PATTERN.search(e.message):
             logger.debug("Old call event received, ignoring")
         else:
             logger.exception(
@@ -116,18 +148,18 @@ async def on_call_connected(
     logger.info("Call connected, asking for language")
 
     # Execute business logic
-    await asyncio.gather(
-        _handle_ivr_language(
-            call=call,
-            client=client,
-            scheduler=scheduler,
-        ),  # First, every time a call is answered, confirm the language
+    await scheduler.spawn(
         _handle_recording(
             call=call,
             client=client,
             server_call_id=server_call_id,
-        ),  # Second, start recording the call
-    )
+        )
+    )  # Start recording the call in the background, it is not needed to greet the caller
+    await _handle_ivr_language(
+        call=call,
+        client=client,
+        scheduler=scheduler,
+    )  # Every time a call is answered, confirm the language
 
     # Add define the call as in progress
     async with _db.call_transac(
@@ -137,7 +169,7 @@ async def on_call_connected(
         call.in_progress = True
         call.recognition_retry = 0
         call.messages.append(
-            MessageModel(
+            MessageModel.model_construct(
                 action=MessageActionEnum.CALL,
                 content="",
                 persona=MessagePersonaEnum.HUMAN,
@@ -207,8 +239,11 @@ async def on_automation_recognize_error(
 
     If the call should continue, increments the recognition retry counter and plays a timeout prompt. Else, hangs up the call.
     """
+    retry_max = await recognition_retry_max()  # Resolve the feature once
+
     if not await _pre_recognize_error(
         call=call,
+        retry_max=retry_max,
         scheduler=scheduler,
     ):
         # Play TTS
@@ -234,7 +269,7 @@ async def on_automation_recognize_error(
     logger.info(
         "Timeout, retrying language selection (%s/%s)",
         call.recognition_retry,
-        await recognition_retry_max(),
+        retry_max,
     )
     await _handle_ivr_language(
         call=call,
@@ -258,6 +293,7 @@ async def on_realtime_recognize_error(
     """
     if not await _pre_recognize_error(
         call=call,
+        retry_max=await recognition_retry_max(),
         scheduler=scheduler,
     ):
         await hangup_realtime_now(
@@ -310,6 +346,7 @@ async def hangup_realtime_now(
 
 async def _pre_recognize_error(
     call: CallStateModel,
+    retry_max: int,
     scheduler: Scheduler,
 ) -> bool:
     """
@@ -320,7 +357,7 @@ async def _pre_recognize_error(
     Returns True if the call should continue, False if it should end.
     """
     # Voice retries are exhausted, end call
-    if call.recognition_retry >= await recognition_retry_max():
+    if call.recognition_retry >= retry_max:
         logger.info("Timeout, ending call")
         return False
 
@@ -416,24 +453,12 @@ async def on_play_error(error_code: int) -> None:
     SpanAttributeEnum.CALL_CHANNEL.attribute("voice")
 
     # Suppress known errors
-    # See: https://github.com/MicrosoftDocs/azure-docs/blob/main/articles/communication-services/how-tos/call-automation/play-action.md
-    match error_code:
-        case 8535:
-            # Action failed, file format
-            logger.warning("Error during media play, file format is invalid")
-        case 8536:
-            # Action failed, file downloaded
-            logger.warning("Error during media play, file could not be downloaded")
-        case 8565:
-            # Action failed, AI services config
-            logger.error(
-                "Error during media play, impossible to connect with Azure AI services"
-            )
-        case 9999:
-            # Unknown error code
-            logger.warning("Error during media play, unknown internal server error")
-        case _:
-            logger.warning("Error during media play, unknown error code %s", error_code)
+    known = _PLAY_ERRORS.get(error_code)
+    if not known:
+        logger.warning("Error during media play, unknown error code %s", error_code)
+        return
+    level, reason = known
+    logger.log(level, "Error during media play, %s", reason)
 
 
 @start_as_current_span("on_ivr_recognized")
@@ -455,14 +480,9 @@ async def on_ivr_recognized(
     SpanAttributeEnum.CALL_MESSAGE.attribute(label)
 
     # Parse language from label
-    try:
-        lang = next(
-            (x for x in call.initiate.lang.availables if x.short_code == label),
-            call.initiate.lang.default_lang,
-        )
-    except ValueError:
-        logger.warning("Unknown IVR %s, code not implemented", label)
-        return
+    lang = call.initiate.lang.availables_by_short_code.get(
+        label, call.initiate.lang.default_lang
+    )
 
     logger.info("Setting call language to %s", lang)
     async with _db.call_transac(
@@ -525,7 +545,7 @@ async def on_sms_received(
         scheduler=scheduler,
     ):
         call.messages.append(
-            MessageModel(
+            MessageModel.model_construct(
                 action=MessageActionEnum.SMS,
                 content=message,
                 lang_short_code=call.lang.short_code,
@@ -567,7 +587,7 @@ async def hangup_now(
         ):
             call.in_progress = False
             call.messages.append(
-                MessageModel(
+                MessageModel.model_construct(
                     action=MessageActionEnum.HANGUP,
                     content="",
                     persona=MessagePersonaEnum.HUMAN,
@@ -596,7 +616,8 @@ async def on_end_call(
         )
         return
 
-    await asyncio.gather(
+    # Jobs are independent, one failing must not cancel the others
+    results = await asyncio.gather(
         _intelligence_next(
             call=call,
             scheduler=scheduler,
@@ -609,7 +630,11 @@ async def on_end_call(
             call=call,
             scheduler=scheduler,
         ),
+        return_exceptions=True,
     )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error("Post-call intelligence failed", exc_info=result)
 
 
 async def _intelligence_sms(
@@ -625,11 +650,41 @@ async def _intelligence_sms(
             return False, "No SMS content", None
         return True, None, req
 
-    content = await completion_sync(
-        res_type=str,
-        system=CONFIG.prompts.llm.sms_summary_system(call),
-        validation_callback=_validate,
+    system = CONFIG.prompts.llm.sms_summary_system(call)
+
+    # Try cache, keyed on the conversation content only, so timestamps and IDs do not make every call unique
+    conversation = orjson.dumps(
+        {
+            "claim": call.claim,
+            "lang": call.lang.short_code,
+            "messages": [
+                (message.persona, message.action, message.content.strip())
+                for message in call.messages
+            ],
+        },
+        default=str,
+        option=orjson.OPT_SORT_KEYS,
     )
+    cache_key = f"{__name__}-intelligence_sms-{hashlib.sha256(conversation, usedforsecurity=False).hexdigest()}"
+    cached = await _cache.get(cache_key)
+    if cached:
+        content = cached.decode()
+
+    # Try live
+    else:
+        content = await completion_sync(
+            res_type=str,
+            system=system,
+            validation_callback=_validate,
+        )
+
+        # Update cache
+        if content:
+            await _cache.set(
+                key=cache_key,
+                ttl_sec=60 * 60,  # 1 hour
+                value=content,
+            )
 
     # Delete action and style from the message as they are in the history and LLM hallucinates them
     _, content = extract_message_style(content or "")
@@ -638,18 +693,20 @@ async def _intelligence_sms(
         logger.warning("Error generating SMS report")
         return
 
-    # Send the SMS to both the current caller and the policyholder
-    success = False
-    for number in set(
-        [call.initiate.phone_number, call.claim.get("policyholder_phone", None)]
-    ):
-        if not number:
-            continue
-        res = await _sms.send(content, number)
+    # Send the SMS to both the current caller and the policyholder, in parallel
+    numbers = {
+        number
+        for number in (
+            call.initiate.phone_number,
+            call.claim.get("policyholder_phone", None),
+        )
+        if number
+    }
+    results = await asyncio.gather(*(_sms.send(content, number) for number in numbers))
+    for number, res in zip(numbers, results, strict=True):
         if not res:
             logger.warning("Failed sending SMS report to %s", number)
-            continue
-        success = True
+    success = any(results)
 
     if success:
         async with _db.call_transac(
@@ -658,7 +715,7 @@ async def _intelligence_sms(
         ):
             # Dont't store the lang as we aren't sure about the language of the SMS
             call.messages.append(
-                MessageModel(
+                MessageModel.model_construct(
                     action=MessageActionEnum.SMS,
                     content=content,
                     persona=MessagePersonaEnum.ASSISTANT,
@@ -675,21 +732,10 @@ async def _intelligence_synthesis(
     """
     logger.debug("Synthesizing call")
 
-    def _validate(
-        req: str | None,
-    ) -> tuple[bool, str | None, SynthesisModel | None]:
-        if not req:
-            return False, "Empty response", None
-        try:
-            return True, None, SynthesisModel.model_validate_json(req)
-        except ValidationError as e:
-            return False, str(e), None
-
     model = await completion_sync(
         res_type=SynthesisModel,
         system=CONFIG.prompts.llm.synthesis_system(call),
         validate_json=True,
-        validation_callback=_validate,
     )
     if not model:
         logger.warning("Error generating synthesis")
@@ -712,21 +758,10 @@ async def _intelligence_next(
     """
     logger.debug("Generating next action")
 
-    def _validate(
-        req: str | None,
-    ) -> tuple[bool, str | None, NextModel | None]:
-        if not req:
-            return False, "Empty response", None
-        try:
-            return True, None, NextModel.model_validate_json(req)
-        except ValidationError as e:
-            return False, str(e), None
-
     model = await completion_sync(
         res_type=NextModel,
         system=CONFIG.prompts.llm.next_system(call),
         validate_json=True,
-        validation_callback=_validate,
     )
     if not model:
         logger.warning("Error generating next action")
@@ -762,26 +797,12 @@ async def _handle_ivr_language(
         )
         return
 
-    tones = [
-        DtmfTone.ONE,
-        DtmfTone.TWO,
-        DtmfTone.THREE,
-        DtmfTone.FOUR,
-        DtmfTone.FIVE,
-        DtmfTone.SIX,
-        DtmfTone.SEVEN,
-        DtmfTone.EIGHT,
-        DtmfTone.NINE,
-    ]
-    choices = []
-    for i, lang in enumerate(call.initiate.lang.availables):
-        choices.append(
-            RecognitionChoice(
-                label=lang.short_code,
-                phrases=lang.pronunciations_en,
-                tone=tones[i],
-            )
+    choices = _ivr_language_choices(
+        tuple(
+            (lang.short_code, tuple(lang.pronunciations_en))
+            for lang in call.initiate.lang.availables
         )
+    )
     await handle_recognize_ivr(
         call=call,
         choices=choices,
@@ -791,6 +812,25 @@ async def _handle_ivr_language(
     )
 
 
+@lru_cache()  # Languages are configured per workflow, so choices are the same for most calls
+def _ivr_language_choices(
+    langs: tuple[tuple[str, tuple[str, ...]], ...],
+) -> list[RecognitionChoice]:
+    """
+    Build the IVR choices from the available languages, as tuples of short code and pronunciations.
+
+    Returns a list of `RecognitionChoice`, shared between calls, that must not be mutated.
+    """
+    return [
+        RecognitionChoice(
+            label=short_code,
+            phrases=list(pronunciations),
+            tone=tone,
+        )
+        for (short_code, pronunciations), tone in zip(langs, _IVR_TONES, strict=False)
+    ]
+
+
 async def _handle_recording(
     call: CallStateModel,
     client: CallAutomationClient,
@@ -751,14 +751,15 @@ class AECStream:
     Input and output formats are in PCM 16-bit, 16 kHz, 1 channel.
     """
 
-    _aec_in_queue: asyncio.Queue[bytes] = asyncio.Queue()
-    _aec_out_queue: asyncio.Queue[tuple[bytes, bool]] = asyncio.Queue()
-    _aec_reference_queue: asyncio.Queue[bytes] = asyncio.Queue()
+    _aec_in_queue: asyncio.Queue[bytes]
+    _aec_out_queue: asyncio.Queue[tuple[bytes, bool]]
+    _aec_reference_queue: asyncio.Queue[bytes]
     _answer_start: float | None = None
+    _bot_voice_buffer: np.ndarray
     _chunk_size: int
     _empty_packet: bytes
     _in_raw_queue: asyncio.Queue[bytes]
-    _in_reference_queue: asyncio.Queue[bytes] = asyncio.Queue()
+    _in_reference_queue: asyncio.Queue[bytes]
     _out_queue: asyncio.Queue[bytes]
     _packet_duration_ms: int
     _packet_size: int
@@ -795,6 +796,11 @@ class AECStream:
         self._sample_rate = sample_rate
         self._scheduler = scheduler
 
+        # Internal queues are owned by the stream, they must not be shared between calls
+        self._aec_in_queue = asyncio.Queue()
+        self._aec_out_queue = asyncio.Queue()
+        self._aec_reference_queue = asyncio.Queue()
+
         max_delay_samples = int(max_delay_ms / 1000 * self._sample_rate)
         self._bot_voice_buffer = np.zeros(max_delay_samples, dtype=np.float32)
 
@@ -835,16 +841,20 @@ class AECStream:
     def _update_input_buffer(self, voice: np.ndarray) -> None:
         """
         Update the rolling buffer for the input voice.
+
+        Buffer is pre-allocated and updated in place, to avoid an allocation for each packet.
         """
         buffer_length = len(self._bot_voice_buffer)
         reference_length = len(voice)
 
         if reference_length >= buffer_length:
             # If the reference is longer than the buffer, keep the most recent samples
-            self._bot_voice_buffer = voice[-buffer_length:]
+            self._bot_voice_buffer[:] = voice[-buffer_length:]
         else:
-            # Append new samples and keep the buffer size fixed
-            self._bot_voice_buffer = np.roll(self._bot_voice_buffer, -reference_length)
+            # Shift the samples left and append the new ones, keeping the buffer size fixed
+            self._bot_voice_buffer[:-reference_length] = self._bot_voice_buffer[
+                reference_length:
+            ]
             self._bot_voice_buffer[-reference_length:] = voice
 
     async def _rms_speech_detection(self, voice: np.ndarray) -> bool:
@@ -1,9 +1,11 @@
 from datetime import datetime
+from functools import cached_property
 from typing import Annotated, Any
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, create_model
 from pydantic.fields import FieldInfo
 
+from app.helpers.cache import lru_cache
 from app.helpers.pydantic_types.phone_numbers import PhoneNumber
 from app.models.claim import ClaimFieldModel, ClaimTypeEnum
 
@@ -62,6 +64,13 @@ class LanguageModel(BaseModel):
         ),
     ]
 
+    @cached_property
+    def availables_by_short_code(self) -> dict[str, LanguageEntryModel]:
+        """
+        Index of the available languages by short code, for constant time lookups.
+        """
+        return {lang.short_code: lang for lang in self.availables}
+
     @property
     def default_lang(self) -> LanguageEntryModel:
         return next(
@@ -136,7 +145,7 @@ class WorkflowInitiateModel(BaseModel):
     def claim_model(self) -> type[BaseModel]:
         return _fields_to_pydantic(
             name="ClaimEntryModel",
-            fields=[
+            fields=(
                 *self.claim,
                 ClaimFieldModel(
                     description="Email of the customer",
@@ -153,7 +162,7 @@ class WorkflowInitiateModel(BaseModel):
                     name="policyholder_phone",
                     type=ClaimTypeEnum.PHONE_NUMBER,
                 ),
-            ],
+            ),
         )
 
 
@@ -162,7 +171,10 @@ class ConversationModel(BaseModel):
     initiate: WorkflowInitiateModel
 
 
-def _fields_to_pydantic(name: str, fields: list[ClaimFieldModel]) -> type[BaseModel]:
+@lru_cache()  # Model is built at each claim validation, and schema build is costly
+def _fields_to_pydantic(
+    name: str, fields: tuple[ClaimFieldModel, ...]
+) -> type[BaseModel]:
     field_definitions = {field.name: _field_to_pydantic(field) for field in fields}
     return create_model(
         name,
@@ -174,20 +174,6 @@ class LlmModel(BaseModel):
         Assistant: style=none I understand, it should be stressful. You can follow his procedure: First, open your mobile app and go to the card section. Second, click on the card you want to block. Third, click on the "Block card" button. Fourth, confirm the blocking. Fifth, call the customer service to report the theft. style=cheerful It'll take you less than 5 minutes. style=none Do you need help with something else?
     """
     sms_summary_system_tpl: str = """
-        # Objective
-        Summarize the call with the customer in a single SMS. The customer cannot reply to this SMS.
-
-        # Rules
-        - Answers in {default_lang}, even if the customer speaks another language
-        - Be concise
-        - Can include personal details about the customer
-        - Do not prefix the response with any text (e.g., "The respond is", "Summary of the call")
-        - Include details stored in the claim, to make the customer confident that the situation is understood
-        - Include salutations (e.g., "Have a nice day", "Best regards", "Best wishes for recovery")
-        - Refer to the customer by their name, if known
-        - Use simple and short sentences
-        - Won't make any assumptions
-
         # Context
 
         ## Conversation objective
@@ -202,6 +188,20 @@ class LlmModel(BaseModel):
         ## Conversation
         {messages}
 
+        # Objective
+        Summarize the call with the customer in a single SMS. The customer cannot reply to this SMS.
+
+        # Rules
+        - Answers in {default_lang}, even if the customer speaks another language
+        - Be concise
+        - Can include personal details about the customer
+        - Do not prefix the response with any text (e.g., "The respond is", "Summary of the call")
+        - Include details stored in the claim, to make the customer confident that the situation is understood
+        - Include salutations (e.g., "Have a nice day", "Best regards", "Best wishes for recovery")
+        - Refer to the customer by their name, if known
+        - Use simple and short sentences
+        - Won't make any assumptions
+
         # Response format
         Hello, I understand [customer's situation]. I confirm [next steps]. [Salutation]. {bot_name} from {bot_company}.
 
@@ -215,15 +215,6 @@ class LlmModel(BaseModel):
         Hello, I had difficulties to hear you. If you need help, let me know how I can help you. Have a nice day! {bot_name} from {bot_company}.
     """
     synthesis_system_tpl: str = """
-        # Objective
-        Synthetize the call.
-
-        # Rules
-        - Answers in English, even if the customer speaks another language
-        - Be concise
-        - Consider all the conversation history, from the beginning
-        - Don't make any assumptions
-
         # Context
 
         ## Conversation objective
@@ -238,6 +229,15 @@ class LlmModel(BaseModel):
         ## Conversation
         {messages}
 
+        # Objective
+        Synthetize the call.
+
+        # Rules
+        - Answers in English, even if the customer speaks another language
+        - Be concise
+        - Consider all the conversation history, from the beginning
+        - Don't make any assumptions
+
         # Response format in JSON
         {format}
     """
@@ -284,16 +284,6 @@ class LlmModel(BaseModel):
         *[your medical appointment]: "I called my family doctor, I have an appointment for the day after tomorrow."
     """
     next_system_tpl: str = """
-        # Objective
-        Choose the next action from the company sales team perspective. The respond is the action to take and the justification for this action.
-
-        # Rules
-        - Answers in English, even if the customer speaks another language
-        - Be concise
-        - Take as priority the customer satisfaction
-        - Won't make any assumptions
-        - Write no more than a few sentences as justification
-
         # Context
 
         ## Conversation objective
@@ -308,6 +298,16 @@ class LlmModel(BaseModel):
         ## Conversation
         {messages}
 
+        # Objective
+        Choose the next action from the company sales team perspective. The respond is the action to take and the justification for this action.
+
+        # Rules
+        - Answers in English, even if the customer speaks another language
+        - Be concise
+        - Take as priority the customer satisfaction
+        - Won't make any assumptions
+        - Write no more than a few sentences as justification
+
         # Response format in JSON
         {format}
     """
@@ -608,13 +608,13 @@ class TtsModel(BaseModel):
         If the translation fails, the initial prompt is returned.
         """
         from app.helpers.translation import (
-            translate_text,
+            translate_prompt,
         )
 
         initial = self._return(prompt_tpls, **kwargs)
         translation = None
         try:
-            translation = await translate_text(
+            translation = await translate_prompt(
                 initial, self.tts_lang, call.lang.short_code
             )
         except HttpResponseError as e:
@@ -39,7 +39,11 @@ async def aiohttp_session() -> ClientSession:
         cookie_jar=await _aiohttp_cookie_jar(),
         trust_env=True,
         # Performance
-        connector=TCPConnector(resolver=AsyncResolver()),
+        connector=TCPConnector(
+            limit=100,  # Same as default, session is shared by all Azure SDKs, including long-lived LLM streams
+            limit_per_host=50,  # Keep room for other services when a single one is slow
+            resolver=AsyncResolver(),
+        ),
         # Reliability
         timeout=ClientTimeout(
             connect=5,
@@ -238,7 +238,9 @@ class DefaultPlugin(AbstractPlugin):
         old_value = self.call.claim.get(field, None)
         try:
             self.call.claim[field] = new_value
-            CallStateModel.model_validate(self.call)  # Force a re-validation
+            self.call.initiate.claim_model().model_validate(
+                self.call.claim
+            )  # Validate the claim only, model_validate returns model instances as-is
             return f'Updated claim field "{field}" with value "{new_value}".'
         # Catch error to inform LLM and rollback changes
         except ValidationError as e:
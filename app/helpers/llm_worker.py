@@ -18,7 +18,7 @@ from azure.core.exceptions import (
     ServiceResponseError,
 )
 from json_repair import repair_json
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 from tenacity import (
     AsyncRetrying,
     retry,
@@ -180,7 +180,8 @@ async def _completion_stream_worker(
 async def completion_sync(
     res_type: type[T],
     system: list[SystemMessage],
-    validation_callback: Callable[[str | None], tuple[bool, str | None, T | None]],
+    validation_callback: Callable[[str | None], tuple[bool, str | None, T | None]]
+    | None = None,
     validate_json: bool = False,
     _previous_result: str | None = None,
     _retries_remaining: int = 3,
@@ -209,8 +210,11 @@ async def completion_sync(
         # See: https://community.openai.com/t/gpt-4-1106-preview-messes-up-function-call-parameters-encoding/478500
         res_content = repair_json(json_str=res_content)  # pyright: ignore
 
-    # Validate
-    is_valid, validation_error, res_object = validation_callback(res_content)
+    # Validate, with the callback if any, else against the response type
+    if validation_callback:
+        is_valid, validation_error, res_object = validation_callback(res_content)
+    else:
+        is_valid, validation_error, res_object = _validate_type(res_content, res_type)
     # Retry if validation failed
     if not is_valid:
         if _retries_remaining == 0:
@@ -234,6 +238,29 @@ async def completion_sync(
     return res_object
 
 
+def _validate_type(  # noqa: UP047 - Same module-level TypeVar as completion_sync
+    content: str | None, res_type: type[T]
+) -> tuple[bool, str | None, T | None]:
+    """
+    Validate a JSON completion against a type.
+
+    Returns a tuple with the validity, the error message if any, and the parsed object if valid.
+    """
+    if not content:
+        return False, "Empty response", None
+    try:
+        return True, None, _type_adapter(res_type).validate_json(content)
+    except ValidationError as e:
+        return False, str(e), None
+
+
+@lru_cache()  # Adapter schema build is costly, reuse it across completions
+def _type_adapter(  # noqa: UP047 - Same module-level TypeVar as completion_sync
+    res_type: type[T],
+) -> TypeAdapter[T]:
+    return TypeAdapter(res_type)
+
+
 async def _completion_sync_worker(
     is_fast: bool,
     system: list[SystemMessage],
@@ -10,7 +10,6 @@ from opentelemetry.instrumentation.aiohttp_client import AioHttpClientInstrument
 from opentelemetry.metrics._internal.instrument import Counter, Gauge
 from opentelemetry.semconv.attributes import service_attributes
 from opentelemetry.trace import Status, StatusCode
-from opentelemetry.trace.span import INVALID_SPAN
 from opentelemetry.util.types import Attributes, AttributeValue
 from structlog.contextvars import bind_contextvars, get_contextvars
 
@@ -50,9 +49,9 @@ class SpanAttributeEnum(str, Enum):
         # Enrich logging
         bind_contextvars(**{self.value: value})
 
-        # Enrich span
+        # Enrich span, if sampled
         span = trace.get_current_span()
-        if span == INVALID_SPAN:
+        if not span.is_recording():
             return
         span.set_attribute(self.value, value)
 
@@ -11,12 +11,16 @@ from tenacity import (
 
 from app.helpers.cache import lru_acache
 from app.helpers.config import CONFIG
+from app.helpers.config_models.cache import MemoryModel
 from app.helpers.http import azure_transport
 from app.helpers.logging import logger
+from app.persistence.memory import MemoryCache
 
 logger.info("Using Translation %s", CONFIG.ai_translation.endpoint)
 
 _cache = CONFIG.cache.instance
+# TTS prompts are a small set of templates, cached locally ahead of the remote cache
+_prompt_cache = MemoryCache(MemoryModel(max_size=256))
 
 
 @retry(
@@ -61,6 +65,32 @@ async def translate_text(text: str, source_lang: str, target_lang: str) -> str |
     return translation
 
 
+async def translate_prompt(text: str, source_lang: str, target_lang: str) -> str | None:
+    """
+    Translate a prompt from source language to target language.
+
+    Prompts are only built from the configuration, never from customer content, so they are kept in process memory. Missing translations are not cached, to be retried on the next call.
+    """
+    # Try cache
+    cache_key = f"{__name__}-translate_prompt-{text}-{source_lang}-{target_lang}"
+    cached = await _prompt_cache.get(cache_key)
+    if cached:
+        return cached.decode()
+
+    # Try live
+    translation = await translate_text(text, source_lang, target_lang)
+
+    # Update cache
+    if translation:
+        await _prompt_cache.set(
+            key=cache_key,
+            ttl_sec=60 * 60 * 24,  # 1 day
+            value=translation,
+        )
+
+    return translation
+
+
 @lru_acache()
 async def _use_client() -> TextTranslationClient:
     """
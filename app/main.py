@@ -1,7 +1,7 @@
 import asyncio
-import json
 import time
 from base64 import b64decode, b64encode
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
 from datetime import timedelta
 from http import HTTPStatus
@@ -11,7 +11,8 @@ from urllib.parse import quote_plus, urljoin
 from uuid import UUID
 
 import jwt
-import mistune
+import orjson
+from aiojobs import Scheduler
 from azure.communication.callautomation import (
     MediaStreamingAudioChannelType,
     MediaStreamingContentType,
@@ -21,8 +22,7 @@ from azure.communication.callautomation import (
 )
 from azure.communication.callautomation.aio import CallAutomationClient
 from azure.core.credentials import AzureKeyCredential
-from azure.core.messaging import CloudEvent
-from azure.eventgrid import EventGridEvent, SystemEventNames
+from azure.eventgrid import SystemEventNames
 from fastapi import (
     FastAPI,
     Form,
@@ -33,15 +33,18 @@ from fastapi import (
     WebSocketDisconnect,
 )
 from fastapi.exceptions import RequestValidationError, ValidationException
-from fastapi.responses import HTMLResponse, JSONResponse
-from htmlmin.minify import html_minify
-from jinja2 import Environment, FileSystemLoader
+from fastapi.responses import (
+    HTMLResponse,
+    ORJSONResponse,
+    StreamingResponse,
+)
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from pydantic import Field, TypeAdapter, ValidationError
 from starlette.datastructures import Headers
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from twilio.twiml.messaging_response import MessagingResponse
 
-from app.helpers.cache import get_scheduler, lru_acache
+from app.helpers.cache import get_scheduler, lru_acache, lru_cache
 from app.helpers.call_events import (
     on_audio_connected,
     on_automation_play_completed,
@@ -58,6 +61,7 @@ from app.helpers.call_events import (
 )
 from app.helpers.call_utils import ContextEnum as CallContextEnum
 from app.helpers.config import CONFIG
+from app.helpers.config_models.cache import MemoryModel
 from app.helpers.http import aiohttp_session, azure_transport
 from app.helpers.logging import logger
 from app.helpers.monitoring import (
@@ -77,6 +81,7 @@ from app.models.readiness import ReadinessCheckModel, ReadinessEnum, ReadinessMo
 from app.persistence.azure_queue_storage import (
     Message as AzureQueueStorageMessage,
 )
+from app.persistence.memory import MemoryCache
 
 # First log
 logger.info(
@@ -88,15 +93,25 @@ logger.info(
 _jinja = Environment(
     auto_reload=False,  # Disable auto-reload for performance
     autoescape=True,
+    bytecode_cache=FileSystemBytecodeCache(),  # Persist compiled templates across restarts
     enable_async=True,
     loader=FileSystemLoader(resources_dir("public_website")),
-    optimized=False,  # Outsource optimization to html_minify
+    lstrip_blocks=True,  # Strip whitespace around tags at compile time, instead of minifying each render
+    optimized=True,  # Fold constant expressions at compile time
+    trim_blocks=True,  # Same as lstrip_blocks
 )
 # Jinja custom functions
 _jinja.filters["quote_plus"] = lambda x: quote_plus(str(x)) if x else ""
-_jinja.filters["markdown"] = lambda x: (
-    mistune.create_markdown(plugins=["abbr", "speedup", "url"])(x) if x else ""
-)  # pyright: ignore
+_jinja.filters["markdown"] = lambda x: _use_markdown()(x) if x else ""  # pyright: ignore
+# Jinja templates, loaded once as they never change at runtime
+_LIST_TPL = _jinja.get_template("list.html.jinja")
+_SINGLE_TPL = _jinja.get_template("single.html.jinja")
+# Jinja static values
+_NEXT_ACTIONS = list(NextActionEnum)
+
+# Pydantic adapters, reused as their schema is costly to build
+_CALL_GET_ADAPTER = TypeAdapter(CallGetModel)
+_CALL_LIST_ADAPTER = TypeAdapter(list[CallGetModel])
 
 # Azure Communication Services
 _source_caller = PhoneNumberIdentifier(CONFIG.communication_services.phone_number)
@@ -118,20 +133,46 @@ _training_queue = CONFIG.queue.training
 
 # Communication Services callback
 assert CONFIG.public_domain, "public_domain config is not set"
-_COMMUNICATIONSERVICES_WSS_TPL = urljoin(
+# URL prefixes are resolved once, only the call ID and secret are appended per call
+_COMMUNICATIONSERVICES_WSS_PREFIX = urljoin(
     str(CONFIG.public_domain).replace("https://", "wss://"),
-    "/communicationservices/wss/{call_id}/{callback_secret}",
+    "/communicationservices/wss/",
 )
-logger.info("Using WebSocket URL %s", _COMMUNICATIONSERVICES_WSS_TPL)
-_COMMUNICATIONSERVICES_CALLABACK_TPL = urljoin(
+logger.info("Using WebSocket URL prefix %s", _COMMUNICATIONSERVICES_WSS_PREFIX)
+_COMMUNICATIONSERVICES_CALLABACK_PREFIX = urljoin(
     str(CONFIG.public_domain),
-    "/communicationservices/callback/{call_id}/{callback_secret}",
+    "/communicationservices/callback/",
 )
-logger.info("Using callback URL %s", _COMMUNICATIONSERVICES_CALLABACK_TPL)
+logger.info("Using callback URL prefix %s", _COMMUNICATIONSERVICES_CALLABACK_PREFIX)
+
+# Readiness probe, cached locally as each instance is probed independently
+_READINESS_CACHE_KEY = f"{__name__}-readiness"
+_READINESS_CACHE_TTL_SEC = 2
+_READINESS_TIMEOUT_SEC = 5
+_readiness_cache = MemoryCache(MemoryModel())
+_readiness_tasks: set[asyncio.Task[ReadinessEnum]] = set()
+
+# Report list page, cached locally as browsers refresh it often and a few seconds of delay is acceptable
+_REPORT_CACHE_TTL_SEC = 10
+_report_cache = MemoryCache(MemoryModel())
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):  # noqa: ARG001
+    # Create shared clients ahead of the first request
+    await asyncio.gather(
+        _use_automation_client(),
+        aiohttp_session(),
+        azure_transport(),
+    )
+
+    # Warm up connections (DNS, TLS, auth) with the readiness checks, without blocking startup if a component is down
+    # Checks are not cancelled on timeout, as they write then delete test data
+    await asyncio.wait(
+        _readiness_checks().values(),
+        timeout=_READINESS_TIMEOUT_SEC,
+    )
+
     queue_tasks = None
 
     try:
@@ -169,6 +210,7 @@ api = FastAPI(
     contact={
         "url": "https://github.com/microsoft/call-center-ai",
     },
+    default_response_class=ORJSONResponse,  # Serialize with orjson, faster than stdlib json
     description="Send a phone call from AI agent, in an API call. Or, directly call the bot from the configured phone number!",
     license_info={
         "name": "Apache-2.0",
@@ -198,7 +240,7 @@ async def health_liveness_get() -> None:
     status_code=HTTPStatus.OK,
 )
 @start_as_current_span("health_readiness_get")
-async def health_readiness_get() -> JSONResponse:
+async def health_readiness_get() -> ORJSONResponse:
     """
     Check if the service is ready to serve requests.
 
@@ -206,36 +248,70 @@ async def health_readiness_get() -> JSONResponse:
 
     Returns a 200 OK if the service is ready to serve requests. If the service is not ready, it should return a 503 Service Unavailable.
     """
-    # Check all components in parallel
-    (
-        cache_check,
-        store_check,
-        search_check,
-        sms_check,
-    ) = await asyncio.gather(
-        _cache.readiness(),
-        _db.readiness(),
-        _search.readiness(),
-        _sms.readiness(),
-    )
-    readiness = ReadinessModel(
-        status=ReadinessEnum.OK,
-        checks=[
-            ReadinessCheckModel(id="cache", status=cache_check),
-            ReadinessCheckModel(id="store", status=store_check),
-            ReadinessCheckModel(id="startup", status=ReadinessEnum.OK),
-            ReadinessCheckModel(id="search", status=search_check),
-            ReadinessCheckModel(id="sms", status=sms_check),
-        ],
-    )
-    # If one of the checks fails, the whole readiness fails
-    status_code = HTTPStatus.OK
-    for check in readiness.checks:
-        if check.status != ReadinessEnum.OK:
-            readiness.status = ReadinessEnum.FAIL
-            status_code = HTTPStatus.SERVICE_UNAVAILABLE
+    # Reuse a recent result, as probes are frequent and checks are costly
+    cached = await _readiness_cache.get(_READINESS_CACHE_KEY)
+    if cached:
+        readiness = ReadinessModel.model_validate_json(cached)
+        return ORJSONResponse(
+            content=readiness.model_dump(mode="json"),
+            status_code=HTTPStatus.OK
+            if readiness.status == ReadinessEnum.OK
+            else HTTPStatus.SERVICE_UNAVAILABLE,
+        )
+
+    # Check all components in parallel, stop waiting at the first failure as it fails the whole readiness, and bound the wait so a slow component cannot hang the probe
+    tasks = _readiness_checks()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + _READINESS_TIMEOUT_SEC
+    pending = set(tasks.values())
+    unfinished_status = ReadinessEnum.UNKNOWN
+
+    def _status(task: asyncio.Task[ReadinessEnum]) -> ReadinessEnum:
+        # A check raising is a failed check, not a server error
+        if not task.done() or task.cancelled():
+            return unfinished_status
+        if task.exception():
+            return ReadinessEnum.FAIL
+        return task.result()
+
+    while pending:
+        done, pending = await asyncio.wait(
+            pending,
+            return_when=asyncio.FIRST_COMPLETED,
+            timeout=deadline - loop.time(),
+        )
+        if not done:
+            logger.warning(
+                "Readiness checks timed out after %ss", _READINESS_TIMEOUT_SEC
+            )
+            unfinished_status = ReadinessEnum.FAIL
+            break
+        if any(_status(task) != ReadinessEnum.OK for task in done):
             break
-    return JSONResponse(
+    statuses = {name: _status(task) for name, task in tasks.items()}
+    for name, task in tasks.items():
+        if task.done() and not task.cancelled() and task.exception():
+            logger.warning("Readiness check %s failed", name, exc_info=task.exception())
+    checks = [
+        ReadinessCheckModel(id="cache", status=statuses["cache"]),
+        ReadinessCheckModel(id="store", status=statuses["store"]),
+        ReadinessCheckModel(id="startup", status=ReadinessEnum.OK),
+        ReadinessCheckModel(id="search", status=statuses["search"]),
+        ReadinessCheckModel(id="sms", status=statuses["sms"]),
+    ]
+    # If one of the checks fails, the whole readiness fails
+    ok = all(check.status == ReadinessEnum.OK for check in checks)
+    status_code = HTTPStatus.OK if ok else HTTPStatus.SERVICE_UNAVAILABLE
+    readiness = ReadinessModel.model_construct(
+        checks=checks,
+        status=ReadinessEnum.OK if ok else ReadinessEnum.FAIL,
+    )  # Skip validation, checks are already validated
+    await _readiness_cache.set(
+        key=_READINESS_CACHE_KEY,
+        ttl_sec=_READINESS_CACHE_TTL_SEC,
+        value=readiness.model_dump_json(),
+    )
+    return ORJSONResponse(
         content=readiness.model_dump(mode="json"),
         status_code=status_code,
     )
@@ -246,23 +322,37 @@ async def health_readiness_get() -> JSONResponse:
     response_class=HTMLResponse,
 )
 @start_as_current_span("report_get")
-async def report_get(phone_number: str | None = None) -> HTMLResponse:
+async def report_get(phone_number: str | None = None) -> Response:
     """
     List all calls with a web interface.
 
     Optional URL parameters:
     - phone_number: Filter by phone number
 
-    Returns a list of calls with a web interface.
+    Returns a list of calls with a web interface. HTML is streamed as it is rendered, then served from a short-lived cache.
     """
     phone_number = PhoneNumber(phone_number) if phone_number else None
     count = 100
+    cache_headers = {
+        "Cache-Control": f"private, max-age={_REPORT_CACHE_TTL_SEC}"
+    }  # Private, as the page contains customer data
+
+    # Try cache
+    cache_key = f"{__name__}-report-{phone_number}-{count}"
+    cached = await _report_cache.get(cache_key)
+    if cached:
+        return HTMLResponse(
+            content=cached,
+            headers=cache_headers,
+            status_code=HTTPStatus.OK,
+        )
+
     calls, total = (
         await _db.call_search_all(count=count, phone_number=phone_number) or []
     )
 
-    template = _jinja.get_template("list.html.jinja")
-    render = await template.render_async(
+    # Stream the page, minification is skipped as it requires the whole document
+    render = _LIST_TPL.generate_async(
         applicationinsights_connection_string=getenv(
             "APPLICATIONINSIGHTS_CONNECTION_STRING"
         ),
@@ -273,9 +363,23 @@ async def report_get(phone_number: str | None = None) -> HTMLResponse:
         total=total,
         version=CONFIG.version,
     )
-    render = html_minify(render)  # Minify HTML
-    return HTMLResponse(
-        content=render,
+
+    async def _render_and_cache() -> AsyncGenerator[str]:
+        # Keep the chunks while streaming, to cache the whole page once rendered
+        chunks = []
+        async for chunk in render:
+            chunks.append(chunk)
+            yield chunk
+        await _report_cache.set(
+            key=cache_key,
+            ttl_sec=_REPORT_CACHE_TTL_SEC,
+            value="".join(chunks),
+        )
+
+    return StreamingResponse(
+        content=_render_and_cache(),
+        headers=cache_headers,
+        media_type="text/html",
         status_code=HTTPStatus.OK,
     )
 
@@ -300,8 +404,7 @@ async def report_single_get(call_id: UUID) -> HTMLResponse:
             status_code=HTTPStatus.NOT_FOUND,
         )
 
-    template = _jinja.get_template("single.html.jinja")
-    render = await template.render_async(
+    render = await _SINGLE_TPL.render_async(
         applicationinsights_connection_string=getenv(
             "APPLICATIONINSIGHTS_CONNECTION_STRING"
         ),
@@ -309,10 +412,9 @@ async def report_single_get(call_id: UUID) -> HTMLResponse:
         bot_name=call.initiate.bot_name,
         bot_phone_number=CONFIG.communication_services.phone_number,
         call=call,
-        next_actions=[action for action in NextActionEnum],
+        next_actions=_NEXT_ACTIONS,
         version=CONFIG.version,
     )
-    render = html_minify(render)  # Minify HTML
     return HTMLResponse(content=render, status_code=HTTPStatus.OK)
 
 
@@ -338,8 +440,8 @@ async def call_list_get(
             status_code=HTTPStatus.NOT_FOUND,
         )
 
-    output = [CallGetModel.model_validate(call) for call in calls or []]
-    return TypeAdapter(list[CallGetModel]).dump_python(output)
+    # Serialize the "CallStateModel" directly, the adapter only dumps the "CallGetModel" fields, without copy nor validation
+    return _CALL_LIST_ADAPTER.dump_python(calls)
 
 
 @api.get("/call/{call_id_or_phone_number}")
@@ -358,7 +460,7 @@ async def call_get(call_id_or_phone_number: str) -> CallGetModel:
         call_id = UUID(call_id_or_phone_number)
         call = await _db.call_get(call_id)
         if call:
-            return TypeAdapter(CallGetModel).dump_python(call)
+            return _CALL_GET_ADAPTER.dump_python(call)
 
     # Second, try to get by phone number
     phone_number = PhoneNumber(call_id_or_phone_number)
@@ -372,7 +474,7 @@ async def call_get(call_id_or_phone_number: str) -> CallGetModel:
             status_code=HTTPStatus.NOT_FOUND,
         )
 
-    return TypeAdapter(CallGetModel).dump_python(call)
+    return _CALL_GET_ADAPTER.dump_python(call)
 
 
 @api.post(
@@ -389,13 +491,13 @@ async def call_post(request: Request) -> CallGetModel:
     Returns a single call object `CallGetModel`, in JSON format.
     """
     try:
-        body = await request.json()
+        body = orjson.loads(await request.body())
         initiate = CallInitiateModel.model_validate(body)
     except ValidationError as e:
         raise RequestValidationError([str(e)]) from e
 
     # Get URLs
-    callback_url, wss_url, call = await _communicationservices_urls(
+    callback_url, wss_url, call, create_task = await _communicationservices_urls(
         initiate.phone_number, initiate
     )
 
@@ -412,20 +514,25 @@ async def call_post(request: Request) -> CallGetModel:
         transport_type=MediaStreamingTransportType.WEBSOCKET,
         transport_url=wss_url,
     )
-    call_connection_properties = await automation_client.create_call(
-        callback_url=callback_url,
-        cognitive_services_endpoint=CONFIG.cognitive_service.endpoint,
-        media_streaming=streaming_options,
-        source_caller_id_number=_source_caller,
-        target_participant=PhoneNumberIdentifier(initiate.phone_number),  # pyright: ignore
-    )
+    try:
+        call_connection_properties = await automation_client.create_call(
+            callback_url=callback_url,
+            cognitive_services_endpoint=CONFIG.cognitive_service.endpoint,
+            media_streaming=streaming_options,
+            source_caller_id_number=_source_caller,
+            target_participant=PhoneNumberIdentifier(initiate.phone_number),  # pyright: ignore
+        )
+    finally:
+        # Make sure the call is persisted before returning
+        if create_task:
+            await create_task
 
     logger.info(
         "Created call with connection id: %s",
         call_connection_properties.call_connection_id,
     )
 
-    return TypeAdapter(CallGetModel).dump_python(call)
+    return _CALL_GET_ADAPTER.dump_python(call)
 
 
 @start_as_current_span("call_event")
@@ -440,32 +547,40 @@ async def call_event(
     Queue message is a JSON object `EventGridEvent` with an event type of `AcsIncomingCallEventName`.
     """
     # Parse event
-    event = EventGridEvent.from_json(call.content)
-    event_type = event.event_type
+    event = orjson.loads(call.content)
+    event_type: str = event["eventType"]
     if not event_type == SystemEventNames.AcsIncomingCallEventName:
         logger.warning("Event %s not supported", event_type)
-        # logger.debug("Event data %s", event.data)
+        # logger.debug("Event data %s", event["data"])
         return
+    data: dict = event["data"]
 
     # Parse phone number
-    call_context: str = event.data["incomingCallContext"]
-    phone_number = PhoneNumber(event.data["from"]["phoneNumber"]["value"])
+    call_context: str = data["incomingCallContext"]
+    phone_number = PhoneNumber(data["from"]["phoneNumber"]["value"])
 
     # Get URLs
-    callback_url, wss_url, _call = await _communicationservices_urls(phone_number)
+    callback_url, wss_url, _call, create_task = await _communicationservices_urls(
+        phone_number
+    )
 
     # Enrich span
     SpanAttributeEnum.CALL_ID.attribute(str(_call.call_id))
     SpanAttributeEnum.CALL_PHONE_NUMBER.attribute(_call.initiate.phone_number)
 
     # Execute business logic
-    await on_new_call(
-        callback_url=callback_url,
-        client=await _use_automation_client(),
-        incoming_context=call_context,
-        phone_number=phone_number,
-        wss_url=wss_url,
-    )
+    try:
+        await on_new_call(
+            callback_url=callback_url,
+            client=await _use_automation_client(),
+            incoming_context=call_context,
+            phone_number=phone_number,
+            wss_url=wss_url,
+        )
+    finally:
+        # Make sure the call is persisted before acknowledging the event
+        if create_task:
+            await create_task
 
 
 @start_as_current_span("sms_event")
@@ -480,17 +595,18 @@ async def sms_event(
     Returns None. Can trigger additional events to `training` and `post` queues.
     """
     # Parse event
-    event = EventGridEvent.from_json(sms.content)
-    event_type = event.event_type
-    logger.debug("SMS event with data %s", event.data)
+    event = orjson.loads(sms.content)
+    event_type: str = event["eventType"]
+    data: dict = event["data"]
+    logger.debug("SMS event with data %s", data)
 
     # Skip non-SMS events
     if not event_type == SystemEventNames.AcsSmsReceivedEventName:
         logger.warning("Event %s not supported", event_type)
         return
 
-    message: str = event.data["message"]
-    phone_number: str = event.data["from"]
+    message: str = data["message"]
+    phone_number: str = data["from"]
 
     # Enrich span
     SpanAttributeEnum.CALL_PHONE_NUMBER.attribute(phone_number)
@@ -719,29 +835,31 @@ async def communicationservices_callback_post(
     # Validate connection
     await _communicationservices_validate_jwt(request.headers)
 
+    # Read request and validate call concurrently, once for the whole batch as all events share the same call
+    body, call = await asyncio.gather(
+        request.body(),
+        _communicationservices_validate_call_id(call_id, secret),
+    )
+
     # Validate request
-    events = await request.json()
+    events = orjson.loads(body)  # Batches can be large, parse faster
     if not events or not isinstance(events, list):
         raise RequestValidationError(["Events must be a list"])
 
-    # Process events in parallel
-    await asyncio.gather(
-        *[
-            _communicationservices_event_worker(
-                call_id=call_id,
+    async with get_scheduler() as scheduler:
+        # Process events in order, on the same call object, to avoid concurrent updates
+        for event in events:
+            await _communicationservices_event_worker(
+                call=call,
                 event_dict=event,
-                secret=secret,
+                scheduler=scheduler,
             )
-            for event in events
-        ]
-    )
 
 
-# TODO: Refacto, too long (and remove PLR0912/PLR0915 ignore)
 async def _communicationservices_event_worker(
-    call_id: UUID,
+    call: CallStateModel,
     event_dict: dict,
-    secret: str,
+    scheduler: Scheduler,
 ) -> None:
     """
     Worker to handle a single event from Azure Communication Services.
@@ -756,127 +874,214 @@ async def _communicationservices_event_worker(
     - Recognize completed
     - Recognize failed
 
+    The call must already be validated by the caller.
+
     Returns None. Can trigger additional events to `training` and `post` queues.
     """
+    # Event parsing, read the fields directly as the SDK model would only copy them
+    data: dict = event_dict["data"]
+    event_type: str = event_dict["type"]
 
-    # Validate connection
-    call = await _communicationservices_validate_call_id(call_id, secret)
-
-    # Event parsing
-    event = CloudEvent.from_dict(event_dict)
-    assert isinstance(event.data, dict)
-
-    async with get_scheduler() as scheduler:
-        # Store connection ID
-        connection_id = event.data["callConnectionId"]
+    # Store connection ID, only when it changes as it is the same for all the events of a call
+    connection_id = data["callConnectionId"]
+    if call.voice_id != connection_id:
         async with _db.call_transac(
             call=call,
             scheduler=scheduler,
         ):
             call.voice_id = connection_id
 
-        # Extract context
-        event_type = event.type
+    # Log
+    logger.debug("Call event received %s", event_type)
 
-        # Extract event context
-        operation_context = event.data.get("operationContext", None)
-        operation_contexts = _str_to_contexts(operation_context)
+    # Dispatch event
+    handler = _COMMUNICATIONSERVICES_EVENT_HANDLERS.get(event_type)
+    if not handler:
+        logger.warning("Event %s not supported", event_type)
+        # logger.debug("Event data %s", data)
+        return
 
-        # Client SDK
-        automation_client = await _use_automation_client()
+    # Extract event context
+    operation_context = data.get("operationContext", None)
+    operation_contexts = _str_to_contexts(operation_context)
 
-        # Log
-        logger.debug("Call event received %s", event_type)
+    await handler(
+        call=call,
+        client=await _use_automation_client(),
+        contexts=operation_contexts,
+        data=data,
+        scheduler=scheduler,
+    )
 
-        match event_type:
-            # Call answered
-            case "Microsoft.Communication.CallConnected":
-                server_call_id = event.data["serverCallId"]
-                await on_call_connected(
-                    call=call,
-                    client=automation_client,
-                    scheduler=scheduler,
-                    server_call_id=server_call_id,
-                )
 
-            # Call hung up
-            case "Microsoft.Communication.CallDisconnected":
-                await on_call_disconnected(
-                    call=call,
-                    client=automation_client,
-                    post_callback=_trigger_post_event,
-                    scheduler=scheduler,
-                )
+async def _communicationservices_on_call_connected(
+    call: CallStateModel,
+    client: CallAutomationClient,
+    contexts: set[CallContextEnum] | None,  # noqa: ARG001
+    data: dict,
+    scheduler: Scheduler,
+) -> None:
+    """
+    Call answered.
+    """
+    server_call_id = data["serverCallId"]
+    await on_call_connected(
+        call=call,
+        client=client,
+        scheduler=scheduler,
+        server_call_id=server_call_id,
+    )
 
-            # Speech/IVR recognized
-            case "Microsoft.Communication.RecognizeCompleted":
-                recognition_result: str = event.data["recognitionType"]
-                # Handle IVR
-                if recognition_result == "choices":
-                    label_detected: str = event.data["choiceResult"]["label"]
-                    await on_ivr_recognized(
-                        call=call,
-                        client=automation_client,
-                        label=label_detected,
-                        scheduler=scheduler,
-                    )
 
-            # Speech/IVR failed
-            case "Microsoft.Communication.RecognizeFailed":
-                result_information = event.data["resultInformation"]
-                error_code: int = result_information["subCode"]
-                error_message: str = result_information["message"]
-                logger.debug(
-                    "Speech recognition failed with error code %s: %s",
-                    error_code,
-                    error_message,
-                )
-                await on_automation_recognize_error(
-                    call=call,
-                    client=automation_client,
-                    contexts=operation_contexts,
-                    post_callback=_trigger_post_event,
-                    scheduler=scheduler,
-                )
+async def _communicationservices_on_call_disconnected(
+    call: CallStateModel,
+    client: CallAutomationClient,
+    contexts: set[CallContextEnum] | None,  # noqa: ARG001
+    data: dict,  # noqa: ARG001
+    scheduler: Scheduler,
+) -> None:
+    """
+    Call hung up.
+    """
+    await on_call_disconnected(
+        call=call,
+        client=client,
+        post_callback=_trigger_post_event,
+        scheduler=scheduler,
+    )
 
-            # Media started
-            case "Microsoft.Communication.PlayStarted":
-                await on_play_started(
-                    call=call,
-                    scheduler=scheduler,
-                )
 
-            # Media played
-            case "Microsoft.Communication.PlayCompleted":
-                await on_automation_play_completed(
-                    call=call,
-                    client=automation_client,
-                    contexts=operation_contexts,
-                    post_callback=_trigger_post_event,
-                    scheduler=scheduler,
-                )
+async def _communicationservices_on_recognize_completed(
+    call: CallStateModel,
+    client: CallAutomationClient,
+    contexts: set[CallContextEnum] | None,  # noqa: ARG001
+    data: dict,
+    scheduler: Scheduler,
+) -> None:
+    """
+    Speech/IVR recognized.
+    """
+    recognition_result: str = data["recognitionType"]
+    # Handle IVR
+    if recognition_result == "choices":
+        label_detected: str = data["choiceResult"]["label"]
+        await on_ivr_recognized(
+            call=call,
+            client=client,
+            label=label_detected,
+            scheduler=scheduler,
+        )
 
-            # Media play failed
-            case "Microsoft.Communication.PlayFailed":
-                result_information = event.data["resultInformation"]
-                error_code: int = result_information["subCode"]
-                await on_play_error(error_code)
-
-            # Call transfer failed
-            case "Microsoft.Communication.CallTransferFailed":
-                result_information = event.data["resultInformation"]
-                sub_code: int = result_information["subCode"]
-                await on_transfer_error(
-                    call=call,
-                    client=automation_client,
-                    error_code=sub_code,
-                    post_callback=_trigger_post_event,
-                    scheduler=scheduler,
-                )
 
-            case _:
-                logger.warning("Event %s not supported", event_type)
-                # logger.debug("Event data %s", event.data)
+async def _communicationservices_on_recognize_failed(
+    call: CallStateModel,
+    client: CallAutomationClient,
+    contexts: set[CallContextEnum] | None,
+    data: dict,
+    scheduler: Scheduler,
+) -> None:
+    """
+    Speech/IVR failed.
+    """
+    result_information = data["resultInformation"]
+    error_code: int = result_information["subCode"]
+    error_message: str = result_information["message"]
+    logger.debug(
+        "Speech recognition failed with error code %s: %s",
+        error_code,
+        error_message,
+    )
+    await on_automation_recognize_error(
+        call=call,
+        client=client,
+        contexts=contexts,
+        post_callback=_trigger_post_event,
+        scheduler=scheduler,
+    )
+
+
+async def _communicationservices_on_play_started(
+    call: CallStateModel,
+    client: CallAutomationClient,  # noqa: ARG001
+    contexts: set[CallContextEnum] | None,  # noqa: ARG001
+    data: dict,  # noqa: ARG001
+    scheduler: Scheduler,
+) -> None:
+    """
+    Media started.
+    """
+    await on_play_started(
+        call=call,
+        scheduler=scheduler,
+    )
+
+
+async def _communicationservices_on_play_completed(
+    call: CallStateModel,
+    client: CallAutomationClient,
+    contexts: set[CallContextEnum] | None,
+    data: dict,  # noqa: ARG001
+    scheduler: Scheduler,
+) -> None:
+    """
+    Media played.
+    """
+    await on_automation_play_completed(
+        call=call,
+        client=client,
+        contexts=contexts,
+        post_callback=_trigger_post_event,
+        scheduler=scheduler,
+    )
+
+
+async def _communicationservices_on_play_failed(
+    call: CallStateModel,  # noqa: ARG001
+    client: CallAutomationClient,  # noqa: ARG001
+    contexts: set[CallContextEnum] | None,  # noqa: ARG001
+    data: dict,
+    scheduler: Scheduler,  # noqa: ARG001
+) -> None:
+    """
+    Media play failed.
+    """
+    result_information = data["resultInformation"]
+    error_code: int = result_information["subCode"]
+    await on_play_error(error_code)
+
+
+async def _communicationservices_on_call_transfer_failed(
+    call: CallStateModel,
+    client: CallAutomationClient,
+    contexts: set[CallContextEnum] | None,  # noqa: ARG001
+    data: dict,
+    scheduler: Scheduler,
+) -> None:
+    """
+    Call transfer failed.
+    """
+    result_information = data["resultInformation"]
+    sub_code: int = result_information["subCode"]
+    await on_transfer_error(
+        call=call,
+        client=client,
+        error_code=sub_code,
+        post_callback=_trigger_post_event,
+        scheduler=scheduler,
+    )
+
+
+# Event handlers, by event type, for a constant time dispatch
+_COMMUNICATIONSERVICES_EVENT_HANDLERS: dict[str, Callable[..., Awaitable[None]]] = {
+    "Microsoft.Communication.CallConnected": _communicationservices_on_call_connected,
+    "Microsoft.Communication.CallDisconnected": _communicationservices_on_call_disconnected,
+    "Microsoft.Communication.CallTransferFailed": _communicationservices_on_call_transfer_failed,
+    "Microsoft.Communication.PlayCompleted": _communicationservices_on_play_completed,
+    "Microsoft.Communication.PlayFailed": _communicationservices_on_play_failed,
+    "Microsoft.Communication.PlayStarted": _communicationservices_on_play_started,
+    "Microsoft.Communication.RecognizeCompleted": _communicationservices_on_recognize_completed,
+    "Microsoft.Communication.RecognizeFailed": _communicationservices_on_recognize_failed,
+}
 
 
 @start_as_current_span("training_event")
@@ -934,8 +1139,13 @@ async def post_event(
 async def _trigger_training_event(call: CallStateModel) -> None:
     """
     Shortcut to add training to the queue.
+
+    Only the last messages are used to search trainings, older ones are not serialized.
     """
-    await _training_queue.send_message(call.model_dump_json(exclude_none=True))
+    light_call = call.model_copy(
+        update={"messages": call.messages[-CONFIG.ai_search.expansion_n_messages :]}
+    )  # Shallow copy, messages are not duplicated
+    await _training_queue.send_message(light_call.model_dump_json(exclude_none=True))
 
 
 async def _trigger_post_event(call: CallStateModel) -> None:
@@ -947,40 +1157,36 @@ async def _trigger_post_event(call: CallStateModel) -> None:
 
 async def _communicationservices_urls(
     phone_number: PhoneNumber, initiate: CallInitiateModel | None = None
-) -> tuple[str, str, CallStateModel]:
+) -> tuple[str, str, CallStateModel, Awaitable[CallStateModel] | None]:
     """
     Generate the callback URL for a call.
 
-    If the caller has already called, use the same call ID, to keep the conversation history. Otherwise, create a new call ID.
+    If the caller has already called, use the same call ID, to keep the conversation history. Otherwise, create a new call ID. The new call is persisted in the background, the returned task must be awaited by the caller.
 
-    Returnes a tuple of the callback URL, the WebSocket URL, and the call object.
+    Returnes a tuple of the callback URL, the WebSocket URL, the call object, and the persistence task if a call was created.
     """
     # Get call
     call = await _db.call_search_one(phone_number)
 
-    # Create new call if initiate is different
+    # Create new call if initiate is different, persisting it while the caller sets up the call
+    create_task = None
     if not call or (initiate and call.initiate != initiate):
-        call = await _db.call_create(
-            CallStateModel(
-                initiate=initiate
-                or CallInitiateModel(
-                    **CONFIG.conversation.initiate.model_dump(),
-                    phone_number=phone_number,
-                )
+        call = CallStateModel(
+            initiate=initiate
+            or CallInitiateModel(
+                **CONFIG.conversation.initiate.model_dump(),
+                phone_number=phone_number,
             )
         )
+        create_task = asyncio.create_task(_db.call_create(call))
 
     # Format URLs
-    wss_url = _COMMUNICATIONSERVICES_WSS_TPL.format(
-        callback_secret=call.callback_secret,
-        call_id=str(call.call_id),
-    )
-    callaback_url = _COMMUNICATIONSERVICES_CALLABACK_TPL.format(
-        callback_secret=call.callback_secret,
-        call_id=str(call.call_id),
+    wss_url = (
+        f"{_COMMUNICATIONSERVICES_WSS_PREFIX}{call.call_id}/{call.callback_secret}"
     )
+    callaback_url = f"{_COMMUNICATIONSERVICES_CALLABACK_PREFIX}{call.call_id}/{call.callback_secret}"
 
-    return callaback_url, wss_url, call
+    return callaback_url, wss_url, call, create_task
 
 
 # TODO: Secure this endpoint with a secret, either in the Authorization header or in the URL
@@ -1045,7 +1251,7 @@ async def twilio_sms_post(
 async def http_exception_handler(
     request: Request,  # noqa: ARG001
     exc: StarletteHTTPException,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle HTTP exceptions and return the error in a standard format.
     """
@@ -1060,26 +1266,58 @@ async def http_exception_handler(
 async def validation_exception_handler(
     request: Request,  # noqa: ARG001
     exc: RequestValidationError,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle validation exceptions and return the error in a standard format.
     """
     return _validation_error(exc)
 
 
+def _readiness_checks() -> dict[str, asyncio.Task[ReadinessEnum]]:
+    """
+    Start the readiness checks of all components.
+
+    Checks write then delete test data, so they must never be cancelled halfway. Tasks are referenced until they complete, even if the caller stops waiting for them.
+
+    Returns a dict of the component name and its check task.
+    """
+    tasks = {
+        "cache": asyncio.create_task(_cache.readiness()),
+        "store": asyncio.create_task(_db.readiness()),
+        "search": asyncio.create_task(_search.readiness()),
+        "sms": asyncio.create_task(_sms.readiness()),
+    }
+    for task in tasks.values():
+        _readiness_tasks.add(task)
+        task.add_done_callback(_readiness_task_done)
+    return tasks
+
+
+def _readiness_task_done(task: asyncio.Task[ReadinessEnum]) -> None:
+    """
+    Release a completed readiness check.
+
+    The exception is retrieved, as a check may complete after its caller stopped waiting.
+    """
+    _readiness_tasks.discard(task)
+    if not task.cancelled():
+        task.exception()
+
+
+@lru_cache()  # Contexts are a small vocabulary, repeated across events
 def _str_to_contexts(value: str | None) -> set[CallContextEnum] | None:
     """
     Convert a string to a set of contexts.
 
-    The string is a JSON array of strings.
+    The string is a JSON array of strings. Results are cached, the returned set must not be mutated.
 
     Returns a set of `CallContextEnum` or None.
     """
     if not value:
         return None
     try:
-        contexts = json.loads(value)
-    except (json.JSONDecodeError, TypeError):
+        contexts = orjson.loads(value)
+    except (orjson.JSONDecodeError, TypeError):
         return None
     res = set()
     for context in contexts:
@@ -1090,7 +1328,7 @@ def _str_to_contexts(value: str | None) -> set[CallContextEnum] | None:
     return res or None
 
 
-def _validation_error(e: ValidationError | Exception) -> JSONResponse:
+def _validation_error(e: ValidationError | Exception) -> ORJSONResponse:
     """
     Generate a standard validation error response.
     """
@@ -1112,7 +1350,7 @@ def _standard_error(
     message: str,
     status_code,
     details: list[str] | None = None,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Generate a standard error response.
     """
@@ -1122,12 +1360,24 @@ def _standard_error(
             message=message,
         )
     )
-    return JSONResponse(
+    return ORJSONResponse(
         content=model.model_dump(mode="json"),
         status_code=status_code,
     )
 
 
+@lru_cache()
+def _use_markdown() -> Callable[[str], str]:
+    """
+    Get the Markdown renderer for the report pages.
+
+    Mistune is imported on first use, as only the report pages need it. The parser is stateless between renders, so it is built once.
+    """
+    import mistune
+
+    return mistune.create_markdown(plugins=["abbr", "speedup", "url"])  # pyright: ignore
+
+
 @lru_acache()
 async def _use_automation_client() -> CallAutomationClient:
     """
@@ -111,13 +111,8 @@ class CallStateModel(CallGetModel, extra="ignore"):
     def lang(self) -> LanguageEntryModel:  # pyright: ignore
         default = self.initiate.lang.default_lang
         if self.lang_short_code:
-            return next(
-                (
-                    lang
-                    for lang in self.initiate.lang.availables
-                    if lang.short_code == self.lang_short_code
-                ),
-                default,
+            return self.initiate.lang.availables_by_short_code.get(
+                self.lang_short_code, default
             )
         return default
 
@@ -175,11 +170,16 @@ class CallStateModel(CallGetModel, extra="ignore"):
         """
         Check if the call had an interaction.
 
-        An interaction is defined as a call with a human message.
+        An interaction is defined as a non-empty human message, spoken or sent by SMS, since the last call started. Previous calls are ignored, as a call can be resumed by the same caller.
         """
-        return not (
-            len(self.messages) >= 3  # noqa: PLR2004
-            and self.messages[-3].action == MessageActionEnum.CALL
-            and self.messages[-2].persona == MessagePersonaEnum.ASSISTANT
-            and self.messages[-1].action == MessageActionEnum.HANGUP
-        )
+        for message in reversed(self.messages):
+            # Stop at the start of the current call
+            if message.action == MessageActionEnum.CALL:
+                break
+            if (
+                message.persona == MessagePersonaEnum.HUMAN
+                and message.action in (MessageActionEnum.TALK, MessageActionEnum.SMS)
+                and message.content.strip()
+            ):
+                return True
+        return False
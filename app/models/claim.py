@@ -14,7 +14,7 @@ class ClaimTypeEnum(str, Enum):
     """Validated as a string."""
 
 
-class ClaimFieldModel(BaseModel):
+class ClaimFieldModel(BaseModel, frozen=True):
     description: str | None = None
     name: str
     type: ClaimTypeEnum
@@ -8,6 +8,8 @@ class ReadinessEnum(str, Enum):
     """The service is not ready."""
     OK = "ok"
     """The service is ready."""
+    UNKNOWN = "unknown"
+    """The check was skipped, as another one already failed."""
 
 
 class ReadinessCheckModel(BaseModel):
@@ -22,6 +22,60 @@ from app.models.readiness import ReadinessEnum
 from app.persistence.icache import ICache
 from app.persistence.istore import IStore
 
+# Maximum operations in a single patch request
+# See: https://learn.microsoft.com/en-us/azure/cosmos-db/partial-document-update#supported-operations
+_PATCH_MAX_OPERATIONS = 10
+
+
+def _patch_operations(
+    init_data: dict[str, Any],
+    update: dict[str, Any],
+) -> list[dict[str, Any]]:
+    """
+    Build the patch operations from the updated fields.
+
+    Lists which only grew, like the messages, are patched by appending the new items, so the request does not grow with the whole history. Other fields are set.
+    """
+    appends: list[dict[str, Any]] = []
+    sets: list[dict[str, Any]] = []
+    for field, value in update.items():
+        init_value = init_data.get(field)
+        if (
+            isinstance(value, list)
+            and isinstance(init_value, list)
+            and len(value) > len(init_value)
+            and value[: len(init_value)] == init_value
+        ):
+            appends.extend(
+                {
+                    "op": "add",
+                    "path": f"/{field}/-",
+                    "value": item,
+                }
+                for item in value[len(init_value) :]
+            )
+        else:
+            sets.append(
+                {
+                    "op": "set",
+                    "path": f"/{field}",
+                    "value": value,
+                }
+            )
+
+    # Fallback to set whole fields if there are too many items to append
+    if len(appends) + len(sets) > _PATCH_MAX_OPERATIONS:
+        return [
+            {
+                "op": "set",
+                "path": f"/{field}",
+                "value": value,
+            }
+            for field, value in update.items()
+        ]
+
+    return sets + appends
+
 
 class CosmosDbStore(IStore):
     _config: CosmosDbModel
@@ -157,14 +211,10 @@ class CosmosDbStore(IStore):
                     remote_raw = await db.patch_item(
                         item=str(call.call_id),
                         partition_key=call.initiate.phone_number,
-                        patch_operations=[
-                            {
-                                "op": "set",
-                                "path": f"/{field}",
-                                "value": value,
-                            }
-                            for field, value in init_update.items()
-                        ],
+                        patch_operations=_patch_operations(
+                            init_data=init_data,
+                            update=init_update,
+                        ),
                     )
             except CosmosHttpResponseError as e:
                 logger.error("Error accessing CosmosDB: %s", e)
@@ -219,16 +269,16 @@ class CosmosDbStore(IStore):
             logger.exception("Error accessing CosmosDB")
         except ValidationError:
             logger.debug("Parsing error", exc_info=True)
-
-        # Update cache
-        cache_key = self._cache_key_call_id(call.call_id)
-        await self._cache.set(
-            key=cache_key,
-            ttl_sec=max(await callback_timeout_hour(), 1)
-            * 60
-            * 60,  # Ensure at least 1 hour
-            value=call.model_dump_json(),
-        )
+        else:
+            # Update cache, only once persisted to not serve a call which does not exist
+            cache_key = self._cache_key_call_id(call.call_id)
+            await self._cache.set(
+                key=cache_key,
+                ttl_sec=max(await callback_timeout_hour(), 1)
+                * 60
+                * 60,  # Ensure at least 1 hour
+                value=call.model_dump_json(),
+            )
 
         # Invalidate phone number cache
         cache_key_phone_number = self._cache_key_phone_number(
@@ -17,12 +17,15 @@ class MemoryCache(ICache):
     See: https://en.wikipedia.org/wiki/Cache_replacement_policies#Least_recently_used_(LRU)
     """
 
-    _cache: OrderedDict[str, bytes | None] = OrderedDict()
+    _cache: OrderedDict[str, bytes | None]
     _config: MemoryModel
-    _ttl: OrderedDict[str, datetime] = OrderedDict()
+    _ttl: OrderedDict[str, datetime]
 
     def __init__(self, config: MemoryModel):
         self._config = config
+        # Per instance, so each cache has its own size limit
+        self._cache = OrderedDict()
+        self._ttl = OrderedDict()
 
     async def readiness(self) -> ReadinessEnum:
         """
@@ -1,6 +1,9 @@
+import asyncio
+
 import pytest
 from pytest_assume.plugin import assume
 
+from app.helpers.cache import lru_acache
 from app.helpers.config import CONFIG
 from app.helpers.config_models.cache import ModeEnum as CacheModeEnum
 
@@ -55,3 +58,31 @@ async def test_acid(
 
     # Check point read
     assume(await cache.get(test_key) == test_value.encode())
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_lru_acache_concurrency() -> None:
+    """
+    Test the async LRU cache computes a value only once, even with concurrent calls.
+
+    Steps:
+    1. Call the cached function many times in parallel
+    2. Check it was computed once
+    3. Check all calls returned the same value
+    """
+    calls = 0
+
+    @lru_acache()
+    async def _compute() -> object:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)  # Let other calls start
+        return object()
+
+    # Call in parallel
+    values = await asyncio.gather(*[_compute() for _ in range(10)])
+
+    # Check computed once
+    assume(calls == 1)
+    # Check same value
+    assume(all(value is values[0] for value in values))
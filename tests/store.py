@@ -4,6 +4,7 @@ from pytest_assume.plugin import assume
 
 from app.helpers.config import CONFIG
 from app.models.call import CallStateModel
+from app.persistence.cosmos_db import _patch_operations
 
 
 @pytest.mark.asyncio(loop_scope="session")
@@ -104,3 +105,75 @@ async def test_transaction(
         # Check point read
         new_call = await db.call_get(call.call_id)
         assume(new_call and new_call.voice_id == random_text and new_call.in_progress)
+
+
+def test_patch_operations_append() -> None:
+    """
+    Test that lists which only grew are patched by appending the new items.
+    """
+    operations = _patch_operations(
+        init_data={"messages": ["a"]},
+        update={"messages": ["a", "b", "c"]},
+    )
+    assume(
+        operations
+        == [
+            {"op": "add", "path": "/messages/-", "value": "b"},
+            {"op": "add", "path": "/messages/-", "value": "c"},
+        ]
+    )
+
+
+def test_patch_operations_list_edit() -> None:
+    """
+    Test that lists edited in place, or shrunk, are set as a whole.
+    """
+    # Edited item
+    operations = _patch_operations(
+        init_data={"messages": ["a", "b"]},
+        update={"messages": ["a", "x", "c"]},
+    )
+    assume(operations == [{"op": "set", "path": "/messages", "value": ["a", "x", "c"]}])
+
+    # Removed item
+    operations = _patch_operations(
+        init_data={"messages": ["a", "b"]},
+        update={"messages": ["a"]},
+    )
+    assume(operations == [{"op": "set", "path": "/messages", "value": ["a"]}])
+
+
+def test_patch_operations_mixed() -> None:
+    """
+    Test that appended lists and set fields are combined in the same patch.
+    """
+    operations = _patch_operations(
+        init_data={"in_progress": False, "messages": ["a"], "voice_id": None},
+        update={"in_progress": True, "messages": ["a", "b"], "voice_id": "id"},
+    )
+    assume(
+        operations
+        == [
+            {"op": "set", "path": "/in_progress", "value": True},
+            {"op": "set", "path": "/voice_id", "value": "id"},
+            {"op": "add", "path": "/messages/-", "value": "b"},
+        ]
+    )
+
+
+def test_patch_operations_too_many() -> None:
+    """
+    Test that patches over the Cosmos DB operations limit set whole fields instead.
+    """
+    messages = [str(i) for i in range(11)]
+    operations = _patch_operations(
+        init_data={"in_progress": False, "messages": []},
+        update={"in_progress": True, "messages": messages},
+    )
+    assume(
+        operations
+        == [
+            {"op": "set", "path": "/in_progress", "value": True},
+            {"op": "set", "path": "/messages", "value": messages},
+        ]
+    )